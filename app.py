@@ -4,12 +4,16 @@ Streamlit-based web interface for the AI documentation generator
 """
 
 import asyncio
+import io
 import logging
 import os
 import sys
+import weakref
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -17,21 +21,23 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 import streamlit as st
 
 import config
-from handlers.analyze import AnalyzeHandler, AnalyzeHandlerConfig
-from handlers.readme import ReadmeHandler, ReadmeHandlerConfig
-from handlers.ai_rules import AIRulesHandler, AIRulesHandlerConfig
 from utils import Logger
 
+# Handler modules pull in pydantic-ai, GitPython and OpenTelemetry, so pages import them lazily
+if TYPE_CHECKING:
+    from handlers.ai_rules import AIRulesHandlerConfig
+    from handlers.analyze import AnalyzeHandlerConfig
+    from handlers.readme import ReadmeHandlerConfig
 
-# Initialize Logger
-log_dir = Path.cwd() / ".logs" / "streamlit" / datetime.now().strftime("%Y_%m_%d")
-log_dir.mkdir(parents=True, exist_ok=True)
-Logger.init(
-    log_dir=log_dir,
-    file_level=logging.INFO,
-    console_level=logging.WARNING,
-    file_name=f"streamlit_{datetime.now().strftime('%H%M%S')}.log"
-)
+
+# Use uvloop for all event loops created by the web frontend where it is available (not on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 # Page configuration
@@ -43,8 +49,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown(
-    """
+_CSS = """
     <style>
     .main-header {
         font-size: 3rem;
@@ -81,9 +86,54 @@ st.markdown(
         margin: 1rem 0;
     }
     </style>
-    """,
-    unsafe_allow_html=True,
-)
+    """
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared thread pool used as the default executor of every session's event loop"""
+    return ThreadPoolExecutor(max_workers=int(os.getenv("THREAD_POOL_SIZE", "64")), thread_name_prefix="docgen")
+
+
+@st.cache_resource
+def _init_logger():
+    """Initialize the Logger once per process"""
+    # Use a single timestamp so the directory date and file time always agree
+    now = datetime.now()
+    log_dir = Path.cwd() / ".logs" / "streamlit" / now.strftime("%Y_%m_%d")
+    log_dir.mkdir(parents=True, exist_ok=True)
+    Logger.init(
+        log_dir=log_dir,
+        file_level=logging.INFO,
+        console_level=logging.WARNING,
+        file_name=f"streamlit_{now.strftime('%H%M%S')}.log",
+    )
+    return Logger
+
+
+@st.cache_resource
+def _inject_css():
+    """Inject the custom CSS, replayed from cache on reruns"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+
+def _close_session_loop(loop: asyncio.AbstractEventLoop):
+    """Close a session's event loop without shutting down the shared executor"""
+    # Closing a loop shuts down its default executor, so first swap in an unused one
+    # (ThreadPoolExecutor starts no threads until work is submitted)
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+    loop.close()
+
+
+class _SessionLoop:
+    """Owns a session's event loop and closes it once the session state holding it is discarded"""
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        self.executor = executor
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(executor)
+        # The finalizer references only the loop, so it does not keep this owner alive
+        weakref.finalize(self, _close_session_loop, self.loop)
 
 
 def init_session_state():
@@ -92,116 +142,318 @@ def init_session_state():
         st.session_state.analysis_running = False
     if "analysis_complete" not in st.session_state:
         st.session_state.analysis_complete = False
+        # Restore the results view of a completed analysis after a browser refresh
+        if st.query_params.get("phase") == "done" and "repo" in st.query_params:
+            docs_path = Path(st.query_params["repo"]) / ".ai" / "docs"
+            if docs_path.is_dir():
+                st.session_state.analysis_complete = True
+                st.session_state.generated_files = [
+                    Path(p) for p in _list_md(str(docs_path), docs_path.stat().st_mtime_ns)
+                ]
     if "generated_files" not in st.session_state:
         st.session_state.generated_files = []
+    if "loop" not in st.session_state:
+        # Reuse one event loop per session instead of creating a new one on every action
+        st.session_state.loop_owner = _SessionLoop(_get_executor())
+        st.session_state.loop = st.session_state.loop_owner.loop
+        st.session_state.executor = st.session_state.loop_owner.executor
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _read_doc(path_str: str, mtime_ns: int) -> str:
+    """Read a generated document, cached until the file's mtime changes"""
+    return Path(path_str).read_text()
+
+
+async def _read_all(paths: list[Path]) -> list[str]:
+    """Read files concurrently on the loop's default executor"""
+    return await asyncio.gather(*[asyncio.to_thread(p.read_text) for p in paths])
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _read_docs(path_strs: tuple[str, ...], mtimes_ns: tuple[int, ...], _loop: asyncio.AbstractEventLoop) -> list[str]:
+    """Read a batch of generated documents concurrently, cached until any file's mtime changes"""
+    return _loop.run_until_complete(_read_all([Path(p) for p in path_strs]))
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _zip_files(paths_and_mtimes: tuple[tuple[str, int], ...], _contents: list[str]) -> bytes:
+    """Bundle already-read file contents into an in-memory zip archive, cached until any file's mtime changes"""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for (path, _), content in zip(paths_and_mtimes, _contents):
+            zf.writestr(Path(path).name, content)
+    return buf.getvalue()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _list_md(dir_str: str, dir_mtime: int) -> list[str]:
+    """List markdown files in a directory, cached until the directory's mtime changes"""
+    return [str(p) for p in Path(dir_str).glob("*.md")]
+
+
+@st.cache_resource
+def _llm_config_strings() -> tuple[str, str, str]:
+    """Format the read-only LLM configuration once per process"""
+    return (
+        f"Model: {config.ANALYZER_LLM_MODEL}\nURL: {config.ANALYZER_LLM_BASE_URL}",
+        f"Model: {config.DOCUMENTER_LLM_MODEL}\nURL: {config.DOCUMENTER_LLM_BASE_URL}",
+        f"Model: {config.AI_RULES_LLM_MODEL}\nURL: {config.AI_RULES_LLM_BASE_URL}",
+    )
+
+
+@st.fragment
 def display_llm_config():
-    """Display current LLM configuration"""
-    with st.sidebar.expander("🤖 LLM Configuration", expanded=False):
+    """Display current LLM configuration (call from within the sidebar)"""
+    analyzer, documenter, ai_rules = _llm_config_strings()
+
+    with st.expander("🤖 LLM Configuration", expanded=False):
         st.markdown("**Analyzer Agent:**")
-        st.code(f"Model: {config.ANALYZER_LLM_MODEL}\nURL: {config.ANALYZER_LLM_BASE_URL}")
-        
+        st.code(analyzer)
+
         st.markdown("**Documenter Agent:**")
-        st.code(f"Model: {config.DOCUMENTER_LLM_MODEL}\nURL: {config.DOCUMENTER_LLM_BASE_URL}")
-        
+        st.code(documenter)
+
         st.markdown("**AI Rules Generator:**")
-        st.code(f"Model: {config.AI_RULES_LLM_MODEL}\nURL: {config.AI_RULES_LLM_BASE_URL}")
+        st.code(ai_rules)
+
+
+def _mark_analysis_complete(repo: Path):
+    """Record a finished analysis in session state and the URL"""
+    st.session_state.analysis_running = False
+    st.session_state.analysis_complete = True
+
+    # Find generated files
+    docs_path = repo / ".ai" / "docs"
+    if docs_path.exists():
+        st.session_state.generated_files = [Path(p) for p in _list_md(str(docs_path), docs_path.stat().st_mtime_ns)]
+
+    # Persist the phase in the URL so a refresh restores the results without rerunning
+    st.query_params["repo"] = str(repo)
+    st.query_params["phase"] = "done"
 
 
-async def run_analysis(repo_path: Path, config_obj: AnalyzeHandlerConfig):
+def _page_header(title: str, subtitle: Optional[str] = None):
+    """Render the page title and subtitle as a single element"""
+    html = f'<div class="main-header">{title}</div>'
+    if subtitle:
+        html += f'<div class="sub-header">{subtitle}</div>'
+    st.markdown(html, unsafe_allow_html=True)
+
+
+async def run_analysis(config_obj: "AnalyzeHandlerConfig"):
     """Run repository analysis"""
+    from handlers.analyze import AnalyzeHandler
+
     handler = AnalyzeHandler(config_obj)
     await handler.handle()
 
 
-async def run_readme_generation(repo_path: Path, config_obj: ReadmeHandlerConfig):
+async def run_readme_generation(config_obj: "ReadmeHandlerConfig"):
     """Run README generation"""
+    from handlers.readme import ReadmeHandler
+
     handler = ReadmeHandler(config_obj)
     await handler.handle()
 
 
-async def run_ai_rules_generation(repo_path: Path, config_obj: AIRulesHandlerConfig):
+async def run_ai_rules_generation(config_obj: "AIRulesHandlerConfig"):
     """Run AI rules generation"""
+    from handlers.ai_rules import AIRulesHandler
+
     handler = AIRulesHandler(config_obj)
     await handler.handle()
 
 
-def analyze_page():
-    """Repository Analysis Page"""
-    st.markdown('<div class="main-header">📊 Repository Analysis</div>', unsafe_allow_html=True)
-    st.markdown(
-        '<div class="sub-header">Analyze your codebase structure, dependencies, data flow, and APIs</div>',
-        unsafe_allow_html=True,
+@st.fragment
+def _render_generated_files(files: list[Path]):
+    """Render generated analysis files without rerunning the whole page"""
+    paths_and_mtimes = tuple((str(p), p.stat().st_mtime_ns) for p in files)
+    contents = _read_docs(
+        tuple(path for path, _ in paths_and_mtimes),
+        tuple(mtime for _, mtime in paths_and_mtimes),
+        st.session_state.loop,
     )
 
-    col1, col2 = st.columns([2, 1])
+    st.download_button(
+        label="⬇️ Download all",
+        data=_zip_files(paths_and_mtimes, contents),
+        file_name="analysis.zip",
+        mime="application/zip",
+        use_container_width=True,
+    )
 
-    with col1:
-        repo_path = st.text_input(
-            "Repository Path",
-            value=str(Path.cwd()),
-            help="Enter the absolute path to the repository you want to analyze",
+    for file_path, content in zip(files, contents):
+        with st.expander(f"📝 {file_path.name}", expanded=False):
+            st.markdown(content)
+
+    with st.expander("⚙️ Advanced: download individual files", expanded=False):
+        for file_path, content in zip(files, contents):
+            st.download_button(
+                label=f"⬇️ {file_path.name}",
+                data=content,
+                file_name=file_path.name,
+                mime="text/markdown",
+            )
+
+
+@st.fragment
+def _render_readme(readme_path: Path):
+    """Render the generated README without rerunning the whole page"""
+    content = _read_doc(str(readme_path), readme_path.stat().st_mtime_ns)
+    st.markdown(content)
+
+    st.download_button(
+        label="⬇️ Download README.md",
+        data=content,
+        file_name="README.md",
+        mime="text/markdown",
+        use_container_width=True,
+    )
+
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _validate_repo(repo_path: str) -> tuple[bool, str]:
+    """Check that a repository path exists and resolve it, cached between rapid reruns"""
+    path = Path(repo_path)
+    if not path.exists():
+        return False, repo_path
+    return True, str(path.resolve())
+
+
+def _scan_dir(dir_path: Path) -> dict[str, os.DirEntry]:
+    """Map entry names to DirEntry objects with a single scandir call"""
+    with os.scandir(dir_path) as it:
+        return {entry.name: entry for entry in it}
+
+
+@st.fragment
+def _render_ai_rules_files(files_to_display: list[tuple[os.DirEntry, str]]):
+    """Render generated AI rules files without rerunning the whole page"""
+    rule_entries = {
+        entry.path: sorted(
+            (e for e in _scan_dir(Path(entry.path)).values() if e.is_file() and e.name.endswith(".md")),
+            key=lambda e: e.name,
         )
+        for entry, _ in files_to_display
+        if entry.is_dir()
+    }
 
-    with col2:
-        max_workers = st.number_input(
-            "Max Workers",
-            min_value=0,
-            max_value=20,
-            value=0,
-            help="Maximum concurrent workers (0=auto-detect CPU count)",
+    # Read every file up front in one concurrent batch
+    to_read = [entry for entry, _ in files_to_display if entry.is_file()]
+    to_read += [e for entries in rule_entries.values() for e in entries]
+    contents = dict(
+        zip(
+            (e.path for e in to_read),
+            _read_docs(
+                tuple(e.path for e in to_read),
+                tuple(e.stat().st_mtime_ns for e in to_read),
+                st.session_state.loop,
+            ),
         )
+    )
 
-    st.markdown("### Analysis Options")
-    col1, col2, col3 = st.columns(3)
+    for entry, display_name in files_to_display:
+        with st.expander(f"📝 {display_name}", expanded=False):
+            if entry.is_dir():
+                st.info(f"Directory created: {entry.path}")
+                for rule_file in rule_entries[entry.path]:
+                    st.markdown(f"**{rule_file.name}**")
+                    st.code(contents[rule_file.path], language="markdown")
+            else:
+                content = contents[entry.path]
+                st.markdown(content)
 
-    with col1:
-        exclude_structure = st.checkbox("Exclude Code Structure", value=False)
-        exclude_dependencies = st.checkbox("Exclude Dependencies", value=False)
+                st.download_button(
+                    label=f"⬇️ Download {display_name}",
+                    data=content,
+                    file_name=display_name,
+                    mime="text/markdown",
+                )
 
-    with col2:
-        exclude_data_flow = st.checkbox("Exclude Data Flow", value=False)
-        exclude_request_flow = st.checkbox("Exclude Request Flow", value=False)
 
-    with col3:
-        exclude_api = st.checkbox("Exclude API Analysis", value=False)
+def analyze_page():
+    """Repository Analysis Page"""
+    _page_header("📊 Repository Analysis", "Analyze your codebase structure, dependencies, data flow, and APIs")
 
-    st.markdown("---")
+    with st.form("analyze_form"):
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            repo_path = st.text_input(
+                "Repository Path",
+                value=str(Path.cwd()),
+                help="Enter the absolute path to the repository you want to analyze",
+            )
+
+        with col2:
+            max_workers = st.number_input(
+                "Max Workers",
+                min_value=0,
+                max_value=20,
+                value=0,
+                help="Maximum concurrent workers (0=auto-detect CPU count)",
+            )
+
+        st.markdown("### Analysis Options")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            exclude_structure = st.checkbox("Exclude Code Structure", value=False)
+            exclude_dependencies = st.checkbox("Exclude Dependencies", value=False)
+
+        with col2:
+            exclude_data_flow = st.checkbox("Exclude Data Flow", value=False)
+            exclude_request_flow = st.checkbox("Exclude Request Flow", value=False)
+
+        with col3:
+            exclude_api = st.checkbox("Exclude API Analysis", value=False)
+
+        st.markdown("---")
 
-    if st.button("🚀 Start Analysis", type="primary", use_container_width=True):
-        if not Path(repo_path).exists():
+        submitted = st.form_submit_button("🚀 Start Analysis", type="primary", use_container_width=True)
+
+    if submitted:
+        exists, resolved = _validate_repo(repo_path)
+        if not exists:
             st.error(f"❌ Repository path does not exist: {repo_path}")
             return
 
+        repo = Path(resolved)
+
+        from handlers.analyze import AnalyzeHandlerConfig
+
         st.session_state.analysis_running = True
         st.session_state.analysis_complete = False
+        st.query_params.pop("phase", None)
+
+        with st.status(
+            "🔍 Analyzing repository... This may take several minutes with local Ollama models.", expanded=True
+        ) as status:
+
+            async def report_progress(message: str):
+                status.write(message)
 
-        with st.spinner("🔍 Analyzing repository... This may take several minutes with local Ollama models."):
             try:
                 config_obj = AnalyzeHandlerConfig(
-                    repo_path=Path(repo_path),
+                    repo_path=repo,
                     exclude_code_structure=exclude_structure,
                     exclude_dependencies=exclude_dependencies,
                     exclude_data_flow=exclude_data_flow,
                     exclude_request_flow=exclude_request_flow,
                     exclude_api_analysis=exclude_api,
                     max_workers=max_workers,
+                    progress_cb=report_progress,
                 )
 
-                asyncio.run(run_analysis(Path(repo_path), config_obj))
+                st.session_state.loop.run_until_complete(run_analysis(config_obj))
 
-                st.session_state.analysis_running = False
-                st.session_state.analysis_complete = True
-
-                # Find generated files
-                docs_path = Path(repo_path) / ".ai" / "docs"
-                if docs_path.exists():
-                    st.session_state.generated_files = list(docs_path.glob("*.md"))
+                _mark_analysis_complete(repo)
 
-                st.success("✅ Analysis completed successfully!")
+                status.update(label="✅ Analysis completed successfully!", state="complete")
 
             except Exception as e:
+                status.update(label="❌ Analysis failed", state="error")
                 st.session_state.analysis_running = False
                 error_msg = f"❌ Analysis failed: {str(e)}"
                 st.error(error_msg)
@@ -214,70 +466,62 @@ def analyze_page():
     if st.session_state.analysis_complete and st.session_state.generated_files:
         st.markdown("### 📄 Generated Analysis Files")
 
-        for file_path in st.session_state.generated_files:
-            with st.expander(f"📝 {file_path.name}", expanded=False):
-                content = file_path.read_text()
-                st.markdown(content)
-
-                col1, col2 = st.columns([1, 4])
-                with col1:
-                    st.download_button(
-                        label="⬇️ Download",
-                        data=content,
-                        file_name=file_path.name,
-                        mime="text/markdown",
-                    )
+        _render_generated_files(st.session_state.generated_files)
 
 
 def readme_page():
     """README Generation Page"""
-    st.markdown('<div class="main-header">📖 README Generator</div>', unsafe_allow_html=True)
-    st.markdown(
-        '<div class="sub-header">Generate comprehensive README.md from your analysis</div>',
-        unsafe_allow_html=True,
-    )
+    _page_header("📖 README Generator", "Generate comprehensive README.md from your analysis")
 
-    col1, col2 = st.columns([2, 1])
+    with st.form("readme_form"):
+        col1, col2 = st.columns([2, 1])
 
-    with col1:
-        repo_path = st.text_input(
-            "Repository Path",
-            value=str(Path.cwd()),
-            help="Enter the absolute path to the repository",
-        )
+        with col1:
+            repo_path = st.text_input(
+                "Repository Path",
+                value=str(Path.cwd()),
+                help="Enter the absolute path to the repository",
+            )
 
-    with col2:
-        use_existing = st.checkbox("Use Existing README", value=False, help="Incorporate existing README content")
+        with col2:
+            use_existing = st.checkbox("Use Existing README", value=False, help="Incorporate existing README content")
 
-    st.markdown("### README Sections to Exclude")
-    col1, col2, col3 = st.columns(3)
+        st.markdown("### README Sections to Exclude")
+        col1, col2, col3 = st.columns(3)
 
-    with col1:
-        exclude_overview = st.checkbox("Exclude Project Overview", value=False)
-        exclude_toc = st.checkbox("Exclude Table of Contents", value=False)
-        exclude_architecture = st.checkbox("Exclude Architecture", value=False)
+        with col1:
+            exclude_overview = st.checkbox("Exclude Project Overview", value=False)
+            exclude_toc = st.checkbox("Exclude Table of Contents", value=False)
+            exclude_architecture = st.checkbox("Exclude Architecture", value=False)
 
-    with col2:
-        exclude_c4 = st.checkbox("Exclude C4 Model", value=False)
-        exclude_structure = st.checkbox("Exclude Repository Structure", value=False)
-        exclude_dependencies = st.checkbox("Exclude Dependencies", value=False)
+        with col2:
+            exclude_c4 = st.checkbox("Exclude C4 Model", value=False)
+            exclude_structure = st.checkbox("Exclude Repository Structure", value=False)
+            exclude_dependencies = st.checkbox("Exclude Dependencies", value=False)
 
-    with col3:
-        exclude_api = st.checkbox("Exclude API Documentation", value=False)
-        exclude_dev_notes = st.checkbox("Exclude Development Notes", value=False)
-        exclude_issues = st.checkbox("Exclude Known Issues", value=False)
+        with col3:
+            exclude_api = st.checkbox("Exclude API Documentation", value=False)
+            exclude_dev_notes = st.checkbox("Exclude Development Notes", value=False)
+            exclude_issues = st.checkbox("Exclude Known Issues", value=False)
 
-    st.markdown("---")
+        st.markdown("---")
 
-    if st.button("📝 Generate README", type="primary", use_container_width=True):
-        if not Path(repo_path).exists():
+        submitted = st.form_submit_button("📝 Generate README", type="primary", use_container_width=True)
+
+    if submitted:
+        exists, resolved = _validate_repo(repo_path)
+        if not exists:
             st.error(f"❌ Repository path does not exist: {repo_path}")
             return
 
+        repo = Path(resolved)
+
+        from handlers.readme import ReadmeHandlerConfig
+
         with st.spinner("📝 Generating README... This may take a few minutes."):
             try:
                 config_obj = ReadmeHandlerConfig(
-                    repo_path=Path(repo_path),
+                    repo_path=repo,
                     use_existing_readme=use_existing,
                     exclude_project_overview=exclude_overview,
                     exclude_table_of_contents=exclude_toc,
@@ -291,24 +535,15 @@ def readme_page():
                     exclude_additional_documentation=False,
                 )
 
-                asyncio.run(run_readme_generation(Path(repo_path), config_obj))
+                st.session_state.loop.run_until_complete(run_readme_generation(config_obj))
 
                 st.success("✅ README generated successfully!")
 
                 # Display generated README
-                readme_path = Path(repo_path) / "README.md"
+                readme_path = repo / "README.md"
                 if readme_path.exists():
                     st.markdown("### 📄 Generated README.md")
-                    content = readme_path.read_text()
-                    st.markdown(content)
-
-                    st.download_button(
-                        label="⬇️ Download README.md",
-                        data=content,
-                        file_name="README.md",
-                        mime="text/markdown",
-                        use_container_width=True,
-                    )
+                    _render_readme(readme_path)
 
             except Exception as e:
                 error_msg = f"❌ README generation failed: {str(e)}"
@@ -321,47 +556,51 @@ def readme_page():
 
 def ai_rules_page():
     """AI Rules Generation Page"""
-    st.markdown('<div class="main-header">🤖 AI Rules Generator</div>', unsafe_allow_html=True)
-    st.markdown(
-        '<div class="sub-header">Generate CLAUDE.md, AGENTS.md, and Cursor rules for AI assistants</div>',
-        unsafe_allow_html=True,
-    )
+    _page_header("🤖 AI Rules Generator", "Generate CLAUDE.md, AGENTS.md, and Cursor rules for AI assistants")
 
-    repo_path = st.text_input(
-        "Repository Path",
-        value=str(Path.cwd()),
-        help="Enter the absolute path to the repository",
-    )
+    with st.form("ai_rules_form"):
+        repo_path = st.text_input(
+            "Repository Path",
+            value=str(Path.cwd()),
+            help="Enter the absolute path to the repository",
+        )
 
-    st.markdown("### Generation Options")
-    col1, col2 = st.columns(2)
+        st.markdown("### Generation Options")
+        col1, col2 = st.columns(2)
 
-    with col1:
-        skip_claude = st.checkbox("Skip Existing CLAUDE.md", value=False)
-        skip_agents = st.checkbox("Skip Existing AGENTS.md", value=False)
-        skip_cursor = st.checkbox("Skip Existing Cursor Rules", value=False)
+        with col1:
+            skip_claude = st.checkbox("Skip Existing CLAUDE.md", value=False)
+            skip_agents = st.checkbox("Skip Existing AGENTS.md", value=False)
+            skip_cursor = st.checkbox("Skip Existing Cursor Rules", value=False)
 
-    with col2:
-        detail_level = st.selectbox(
-            "Detail Level",
-            options=["minimal", "standard", "comprehensive"],
-            index=1,
-            help="Level of detail in generated files",
-        )
-        max_claude_lines = st.number_input("Max CLAUDE.md Lines", value=500, min_value=100, max_value=2000)
-        max_agents_lines = st.number_input("Max AGENTS.md Lines", value=150, min_value=50, max_value=500)
+        with col2:
+            detail_level = st.selectbox(
+                "Detail Level",
+                options=["minimal", "standard", "comprehensive"],
+                index=1,
+                help="Level of detail in generated files",
+            )
+            max_claude_lines = st.number_input("Max CLAUDE.md Lines", value=500, min_value=100, max_value=2000)
+            max_agents_lines = st.number_input("Max AGENTS.md Lines", value=150, min_value=50, max_value=500)
 
-    st.markdown("---")
+        st.markdown("---")
 
-    if st.button("🚀 Generate AI Rules", type="primary", use_container_width=True):
-        if not Path(repo_path).exists():
+        submitted = st.form_submit_button("🚀 Generate AI Rules", type="primary", use_container_width=True)
+
+    if submitted:
+        exists, resolved = _validate_repo(repo_path)
+        if not exists:
             st.error(f"❌ Repository path does not exist: {repo_path}")
             return
 
+        repo = Path(resolved)
+
+        from handlers.ai_rules import AIRulesHandlerConfig
+
         with st.spinner("🤖 Generating AI rules... This may take a few minutes."):
             try:
                 config_obj = AIRulesHandlerConfig(
-                    repo_path=Path(repo_path),
+                    repo_path=repo,
                     skip_existing_claude_md=skip_claude,
                     skip_existing_agents_md=skip_agents,
                     skip_existing_cursor_rules=skip_cursor,
@@ -370,37 +609,29 @@ def ai_rules_page():
                     max_agents_lines=max_agents_lines,
                 )
 
-                asyncio.run(run_ai_rules_generation(Path(repo_path), config_obj))
+                st.session_state.loop.run_until_complete(run_ai_rules_generation(config_obj))
 
                 st.success("✅ AI rules generated successfully!")
 
                 # Display generated files
                 st.markdown("### 📄 Generated Files")
 
+                entries = _scan_dir(repo)
+                cursor_entries = {}
+                if ".cursor" in entries and entries[".cursor"].is_dir():
+                    cursor_entries = _scan_dir(Path(entries[".cursor"].path))
+
                 files_to_display = [
-                    (Path(repo_path) / "CLAUDE.md", "CLAUDE.md"),
-                    (Path(repo_path) / "AGENTS.md", "AGENTS.md"),
-                    (Path(repo_path) / ".cursor" / "rules", "Cursor Rules"),
+                    (entry, display_name)
+                    for entry, display_name in [
+                        (entries.get("CLAUDE.md"), "CLAUDE.md"),
+                        (entries.get("AGENTS.md"), "AGENTS.md"),
+                        (cursor_entries.get("rules"), "Cursor Rules"),
+                    ]
+                    if entry is not None and (entry.is_file() or entry.is_dir())
                 ]
 
-                for file_path, display_name in files_to_display:
-                    if file_path.exists():
-                        with st.expander(f"📝 {display_name}", expanded=False):
-                            content = file_path.read_text() if file_path.is_file() else ""
-                            if file_path.is_dir():
-                                st.info(f"Directory created: {file_path}")
-                                for rule_file in file_path.glob("*.md"):
-                                    st.markdown(f"**{rule_file.name}**")
-                                    st.code(rule_file.read_text(), language="markdown")
-                            else:
-                                st.markdown(content)
-
-                                st.download_button(
-                                    label=f"⬇️ Download {display_name}",
-                                    data=content,
-                                    file_name=display_name,
-                                    mime="text/markdown",
-                                )
+                _render_ai_rules_files(files_to_display)
 
             except Exception as e:
                 error_msg = f"❌ AI rules generation failed: {str(e)}"
@@ -411,9 +642,109 @@ def ai_rules_page():
                     pass  # Logger might not be available
 
 
+async def run_all_generation(
+    analyze_config: "AnalyzeHandlerConfig",
+    readme_config: "ReadmeHandlerConfig",
+    ai_rules_config: "AIRulesHandlerConfig",
+) -> dict[str, Optional[Exception]]:
+    """
+    Run analysis, then README and AI rules generation concurrently.
+
+    Returns the exception (or None on success) for each step that ran; steps skipped
+    because analysis failed are left out.
+    """
+    # README and AI rules generation both read the analysis output, so analysis must finish first
+    try:
+        await run_analysis(analyze_config)
+    except Exception as e:
+        return {"Analysis": e}
+
+    readme_result, ai_rules_result = await asyncio.gather(
+        run_readme_generation(readme_config),
+        run_ai_rules_generation(ai_rules_config),
+        return_exceptions=True,
+    )
+
+    # Cancellation and Streamlit rerun/stop requests are BaseExceptions that must propagate, not count as success
+    for result in (readme_result, ai_rules_result):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+
+    return {
+        "Analysis": None,
+        "README": readme_result if isinstance(readme_result, BaseException) else None,
+        "AI Rules": ai_rules_result if isinstance(ai_rules_result, BaseException) else None,
+    }
+
+
+def generate_all_page():
+    """Generate All Page"""
+    _page_header("🚀 Generate All", "Run analysis, README and AI rules generation in one go")
+
+    repo_path = st.text_input(
+        "Repository Path",
+        value=str(Path.cwd()),
+        help="Enter the absolute path to the repository",
+    )
+
+    st.markdown("---")
+
+    if st.button("🚀 Generate All", type="primary", use_container_width=True):
+        exists, resolved = _validate_repo(repo_path)
+        if not exists:
+            st.error(f"❌ Repository path does not exist: {repo_path}")
+            return
+
+        repo = Path(resolved)
+
+        from handlers.ai_rules import AIRulesHandlerConfig
+        from handlers.analyze import AnalyzeHandlerConfig
+        from handlers.readme import ReadmeHandlerConfig
+
+        st.session_state.analysis_running = True
+        st.session_state.analysis_complete = False
+        st.query_params.pop("phase", None)
+
+        with st.spinner("🚀 Generating documentation... This may take several minutes."):
+            try:
+                results = st.session_state.loop.run_until_complete(
+                    run_all_generation(
+                        AnalyzeHandlerConfig(repo_path=repo),
+                        ReadmeHandlerConfig(repo_path=repo),
+                        AIRulesHandlerConfig(repo_path=repo),
+                    )
+                )
+            except Exception as e:
+                st.session_state.analysis_running = False
+                st.error(f"❌ Generation failed: {str(e)}")
+                try:
+                    Logger.error(f"Generate all error: {e}", exc_info=True)
+                except Exception:
+                    pass  # Logger might not be available
+                return
+
+        # Make the analysis results available on the Analysis page, as if it had been run there
+        if results["Analysis"] is None:
+            _mark_analysis_complete(repo)
+        else:
+            st.session_state.analysis_running = False
+
+        for name in ("Analysis", "README", "AI Rules"):
+            if name not in results:
+                st.warning(f"⚠️ {name} skipped because analysis failed")
+            elif results[name] is None:
+                st.success(f"✅ {name} completed successfully!")
+            else:
+                st.error(f"❌ {name} failed: {str(results[name])}")
+                try:
+                    Logger.error(f"{name} error: {results[name]}", exc_info=results[name])
+                except Exception:
+                    pass  # Logger might not be available
+
+
 def about_page():
     """About Page"""
-    st.markdown('<div class="main-header">ℹ️ About AI Doc Gen</div>', unsafe_allow_html=True)
+    _page_header("ℹ️ About AI Doc Gen")
 
     st.markdown(
         """
@@ -496,35 +827,31 @@ Timeout: {config.DOCUMENTER_LLM_TIMEOUT}s"""
 
 def main():
     """Main application entry point"""
+    _init_logger()
+    _inject_css()
     init_session_state()
 
-    # Sidebar navigation
-    with st.sidebar:
-        st.markdown("## 📚 AI Doc Gen")
-        st.markdown("---")
-
-        page = st.radio(
-            "Navigation",
-            ["📊 Analysis", "📖 README", "🤖 AI Rules", "ℹ️ About"],
-            label_visibility="collapsed",
-        )
+    # Only the selected page's function runs on each rerun
+    page = st.navigation(
+        [
+            st.Page(analyze_page, title="Analysis", icon="📊", url_path="analysis", default=True),
+            st.Page(readme_page, title="README", icon="📖", url_path="readme"),
+            st.Page(ai_rules_page, title="AI Rules", icon="🤖", url_path="ai-rules"),
+            st.Page(generate_all_page, title="Generate All", icon="🚀", url_path="generate-all"),
+            st.Page(about_page, title="About", icon="ℹ️", url_path="about"),
+        ]
+    )
 
+    with st.sidebar:
         st.markdown("---")
+        st.markdown("## 📚 AI Doc Gen")
         display_llm_config()
 
         st.markdown("---")
         st.caption(f"Version: {config.VERSION}")
         st.caption("Made with ❤️ using Streamlit")
 
-    # Route to selected page
-    if page == "📊 Analysis":
-        analyze_page()
-    elif page == "📖 README":
-        readme_page()
-    elif page == "🤖 AI Rules":
-        ai_rules_page()
-    elif page == "ℹ️ About":
-        about_page()
+    page.run()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 import time
 from functools import partial
 from pathlib import Path
-from typing import List, Tuple
+from typing import Awaitable, Callable, List, Optional, Tuple
 
 from opentelemetry import trace
 from pydantic import BaseModel, Field
@@ -29,8 +29,13 @@ class AnalyzerAgentConfig(BaseModel):
 
 
 class AnalyzerAgent:
-    def __init__(self, cfg: AnalyzerAgentConfig) -> None:
+    def __init__(
+        self,
+        cfg: AnalyzerAgentConfig,
+        progress_cb: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> None:
         self._config = cfg
+        self._progress_cb = progress_cb
 
         self._prompt_manager = PromptManager(file_path=Path(__file__).parent / "prompts" / "analyzer.yaml")
 
@@ -116,11 +121,16 @@ class AnalyzerAgent:
 
         # Log results with agent names (dict order is preserved)
         for agent_name, result in zip(agent_tasks.keys(), results):
-            if isinstance(result, Exception):
-                Logger.error(f"Agent {agent_name} failed: {result}", exc_info=True)
+            if isinstance(result, BaseException):
+                Logger.error(f"Agent {agent_name} failed: {result!r}", exc_info=result)
             else:
                 Logger.info(f"Agent {agent_name} completed successfully")
 
+        # Propagate cancellation and other control-flow BaseExceptions (e.g. raised by a progress callback)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
         self.validate_succession(analysis_files)
 
     def validate_succession(self, analysis_files: List[Path]):
@@ -150,6 +160,8 @@ class AnalyzerAgent:
     async def _run_agent(self, agent: Agent, user_prompt: str, file_path: Path):
         trace.get_current_span().add_event(name=f"Running {agent.name}", attributes={"agent_name": agent.name})
 
+        await self._report_progress(f"Running {agent.name}")
+
         try:
             Logger.info(f"Running {agent.name}")
             start_time = time.time()
@@ -182,11 +194,26 @@ class AnalyzerAgent:
 
         except UnexpectedModelBehavior as e:
             Logger.info(f"Unexpected model behavior: {e}", exc_info=True)
+            await self._report_progress(f"{agent.name} failed")
             raise
         except Exception as e:
             Logger.info(f"Error running agent: {e}", exc_info=True)
+            await self._report_progress(f"{agent.name} failed")
             raise
 
+        await self._report_progress(f"{agent.name} completed")
+
+    async def _report_progress(self, message: str):
+        if self._progress_cb is None:
+            return
+
+        try:
+            await self._progress_cb(message)
+        except Exception as e:
+            # Progress reporting is best-effort and must never fail the analysis; control-flow
+            # BaseExceptions (e.g. a UI rerun request) intentionally propagate and are re-raised by run()
+            Logger.warning(f"Progress callback failed: {e}", exc_info=True)
+
     @property
     def _llm_model(self) -> Tuple[Model, ModelSettings]:
         retrying_http_client = create_retrying_client()
@@ -1,4 +1,7 @@
+from typing import Awaitable, Callable, Optional
+
 from opentelemetry import trace
+from pydantic import Field
 
 from agents.analyzer import AnalyzerAgent, AnalyzerAgentConfig
 from utils import Logger
@@ -8,14 +11,18 @@ from .base_handler import BaseHandler, BaseHandlerConfig
 
 
 class AnalyzeHandlerConfig(BaseHandlerConfig, AnalyzerAgentConfig):
-    pass
+    progress_cb: Optional[Callable[[str], Awaitable[None]]] = Field(
+        default=None,
+        exclude=True,
+        description="Async callback receiving progress messages while the analyzer agents run",
+    )
 
 
 class AnalyzeHandler(BaseHandler):
     def __init__(self, config: AnalyzeHandlerConfig):
         super().__init__(config)
 
-        self.agent = AnalyzerAgent(config)
+        self.agent = AnalyzerAgent(config, progress_cb=config.progress_cb)
 
     async def handle(self):
         Logger.info("Starting analyze handler")
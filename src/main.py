@@ -103,6 +103,10 @@ async def cronjob_analyze(args: argparse.Namespace):
 
 
 def _add_field_arg(handler_group: argparse.ArgumentParser, field_name: str, field_info: FieldInfo):
+    # Runtime-only fields (e.g. callbacks) are not configurable from the CLI
+    if field_info.exclude:
+        return
+
     arg_name = f"--{field_name.replace('_', '-')}"
     help_text = field_info.description
 
@@ -1,8 +1,23 @@
+from importlib import import_module
+
 from .dict import merge_dicts
 from .logger import Logger
-from .prompt_manager import PromptManager
 from .repo import get_repo_version
-from .retry_client import create_retrying_client
 from .worker_pool import WorkerPool
 
 __all__ = ["Logger", "PromptManager", "merge_dicts", "get_repo_version", "create_retrying_client", "WorkerPool"]
+
+# Exports whose modules pull in heavy dependencies (jinja2, pydantic-ai, httpx) are imported on first use
+_LAZY_EXPORTS = {
+    "PromptManager": ".prompt_manager",
+    "create_retrying_client": ".retry_client",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")